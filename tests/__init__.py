@@ -0,0 +1,9 @@
+"""
+Test package for the Product Service
+
+Flags the service as running under test before it is imported so that
+service.config falls back to an in-memory SQLite database
+"""
+import os
+
+os.environ.setdefault("TESTING", "1")